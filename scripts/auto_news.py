@@ -2,14 +2,19 @@
 import os
 import re
 import json
+import atexit
+import argparse
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
-from dateutil.parser import parse as dtparse
 
-PUBLISH_NOW = os.getenv("PUBLISH_NOW", "false").lower() == "true"
-OUTPUT_DIR = "_posts/automated-news" if PUBLISH_NOW else "drafts"
-os.makedirs(OUTPUT_DIR, exist_ok=True)   # <— add this once near the top
+try:
+    from orjson import loads as json_loads
+except ImportError:  # stdlib json accepts bytes too, just slower
+    from json import loads as json_loads
 
 # -------------------------------------------------------------------
 # Config
@@ -17,58 +22,173 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)   # <— add this once near the top
 FEED_URL = os.getenv("INOREADER_JSON_URL", "").strip()
 HOURS = int(os.getenv("HOURS", "6"))
 MAX_POSTS = int(os.getenv("MAX_POSTS", "3"))
+DRY = os.getenv("DRY", "false").lower() == "true"
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
 PUBLISH_NOW = os.getenv("PUBLISH_NOW", "false").lower() == "true"
 LOCAL_TZ = ZoneInfo("Asia/Dubai")  # GMT+4
 
+_SLUG_RE = re.compile(r"[^a-z0-9\-]+")
+_WS_RE = re.compile(r"\s+")
+_WORD_RE = re.compile(r"\w+")
+# Characters YAML rejects or folds in a title; \t \n \r are escaped by _yaml_str instead.
+_CTRL_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f\u2028\u2029\ud800-\udfff\ufffe\uffff]")
+
 OUTPUT_DIR = "_posts/automated-news" if PUBLISH_NOW else "drafts"
 
+# One pooled session so repeat hosts reuse the TCP/TLS connection.
+HTTP_TIMEOUT = (5, 20)  # (connect, read) seconds
+# Ignore Retry-After: a rate-limited feed would otherwise stall the job for as long as the server asks.
+_retry = Retry(
+    total=2,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=False,
+)
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "tpd-auto-news/1.0"})
+SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=_retry))
+SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=_retry))
+atexit.register(SESSION.close)
+
 # -------------------------------------------------------------------
 # Helpers
 # -------------------------------------------------------------------
+def fetch(url: str) -> bytes:
+    """GET a URL through the shared session and return the raw body."""
+    r = SESSION.get(url, timeout=HTTP_TIMEOUT)
+    r.raise_for_status()
+    return r.content
+
+
 def parse_item_dt(it: dict):
     """Return UTC datetime from known fields or None."""
     for k in ("date_published", "published", "updated"):
         v = it.get(k)
-        if v:
+        if not v:
+            continue
+        if isinstance(v, (int, float)):  # epoch seconds
             try:
+                return datetime.fromtimestamp(v, timezone.utc)
+            except (OverflowError, OSError, ValueError):
+                continue
+        if isinstance(v, str):
+            # Inoreader emits strict ISO 8601; only odd formats need dateutil.
+            try:
+                return datetime.fromisoformat(v.replace("Z", "+00:00")).astimezone(timezone.utc)
+            except ValueError:
+                pass
+            try:
+                from dateutil.parser import parse as dtparse
                 return dtparse(v).astimezone(timezone.utc)
             except Exception:
                 pass
     return None
 
 
+_HTML_PARSER = None  # selectolax parser class, or False when it is not installed
+
+
+def _html_parser():
+    """Import selectolax on first use, so runs with nothing to strip never load it."""
+    global _HTML_PARSER
+    if _HTML_PARSER is None:
+        try:
+            from selectolax.lexbor import LexborHTMLParser
+            _HTML_PARSER = LexborHTMLParser
+        except ImportError:  # fall back to lxml
+            _HTML_PARSER = False
+    return _HTML_PARSER
+
+
 def strip_html(text: str) -> str:
-    return re.sub(r"<[^>]+>", " ", text or "")
+    """Plain text of an HTML fragment, without script/style bodies."""
+    parser = _html_parser()
+    if not parser:
+        return _strip_html_lxml(text or "")
+    tree = parser(text or "")
+    for node in tree.css("script,style,noscript"):
+        node.decompose()
+    body = tree.body.text(separator=" ", strip=True) if tree.body else ""
+    return _WS_RE.sub(" ", body).strip()
+
+
+_LXML_PARSER = None  # built on first use, then shared by every fallback parse
+
+
+def _strip_html_lxml(text: str) -> str:
+    global _LXML_PARSER
+    from lxml import etree, html as lxml_html
+    if _LXML_PARSER is None:
+        _LXML_PARSER = lxml_html.HTMLParser(remove_blank_text=True, recover=True)
+    try:
+        tree = lxml_html.fromstring(text, parser=_LXML_PARSER)
+    except (etree.ParserError, ValueError):  # empty or whitespace-only input
+        return ""
+    # Empty rather than strip them, so the text either side stays separate.
+    for node in list(tree.iter("script", "style", "noscript")):
+        node.clear(keep_tail=True)
+    # itertext keeps adjacent blocks and <br>-separated runs apart; text_content() would not.
+    return _WS_RE.sub(" ", " ".join(tree.itertext())).strip()
+
+
+def shorthash(s: str) -> str:
+    """10 hex chars identifying s."""
+    return hashlib.blake2b(s.encode("utf-8"), digest_size=5).hexdigest()
 
 
 def clean_title(title: str) -> str:
-    """Remove quotes that break YAML front matter."""
-    return (title or "Untitled").replace('"', "'").strip()
+    return _CTRL_RE.sub("", title or "").strip() or "Untitled"
+
+
+def _yaml_str(s: str) -> str:
+    """Double-quoted YAML scalar for a front-matter value."""
+    s = s.replace("\\", "\\\\").replace('"', '\\"')
+    return '"' + s.replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t") + '"'
 
 
 def pretty_reason(keep: bool, title: str, reason: str):
     print(f"[{'KEEP' if keep else 'DROP'}] {title[:100]} — {reason}")
 
 
-def write_post(item, pub_local: datetime, body: str):
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+def write_atomic(path: str, data: bytes):
+    """Write via a temp file and os.replace so a killed run never leaves half a post."""
+    # Dot-prefixed so Jekyll never treats a leftover temp file as a post.
+    d, name = os.path.split(path)
+    tmp = os.path.join(d, f".{name}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
 
+def write_post(item, pub_local: datetime, body: str, dry: bool = False):
     title = clean_title(item.get("title") or item.get("summary") or "Untitled")
-    slug = re.sub(r"[^a-z0-9\-]+", "-", title.lower()).strip("-")
+    # Titles with no ASCII letters would all slug to "", so fall back to a hash.
+    slug = _SLUG_RE.sub("-", title.lower()).strip("-") or shorthash(title)
     date_prefix = pub_local.strftime("%Y-%m-%d")
     filename = f"{date_prefix}-{slug[:50]}.md"
     path = os.path.join(OUTPUT_DIR, filename)
 
-    lines = []
-    lines.append("---")
-    lines.append(f'title: "{title}"')
-    lines.append(f"date: {pub_local.strftime('%Y-%m-%d %H:%M:%S %z')}")
-    lines.append("---")
-    lines.append("")
-    lines.append(body.strip())
-
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    out = (
+        "---\n"
+        f"title: {_yaml_str(title)}\n"
+        f"date: {pub_local.strftime('%Y-%m-%d %H:%M:%S %z')}\n"
+        "---\n"
+        "\n"
+        f"{body.strip()}"
+    )
+    if dry:
+        print(f"[dry-run] Would write draft: {path}")
+        return
+    write_atomic(path, out.encode("utf-8"))
 
     print(f"Wrote draft: {path}")
 
@@ -76,19 +196,36 @@ def write_post(item, pub_local: datetime, body: str):
 # -------------------------------------------------------------------
 # Main
 # -------------------------------------------------------------------
-def main():
+def parse_args(argv=None):
+    """CLI flags; each one defaults to its environment variable."""
+    p = argparse.ArgumentParser(description="Draft posts from the Inoreader JSON feed.")
+    p.add_argument("--hours", type=int, default=HOURS, help="look-back window in hours (env HOURS)")
+    p.add_argument("--max-posts", type=int, default=MAX_POSTS, help="drafts per run (env MAX_POSTS)")
+    p.add_argument("--dry-run", action="store_true", default=DRY, help="report drafts without writing them (env DRY)")
+    p.add_argument("--debug", action="store_true", default=DEBUG, help="add item ids and raw dates to KEEP/DROP lines (env DEBUG)")
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
     if not FEED_URL:
         raise SystemExit("❌ No INOREADER_JSON_URL set in env/config.")
+    if not args.dry_run:
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    def log(keep: bool, it: dict, title: str, reason: str):
+        if args.debug:
+            raw = it.get("date_published") or it.get("published") or it.get("updated")
+            reason = f"{reason} [id={it.get('id') or it.get('url')} date={raw!r}]"
+        pretty_reason(keep, title, reason)
 
     print(f"Fetching: {FEED_URL}")
-    r = requests.get(FEED_URL)
-    r.raise_for_status()
-    feed = r.json()
+    feed = json_loads(fetch(FEED_URL))
 
     items = feed.get("items", [])
     print(f"Items in feed: {len(items)}")
 
-    cutoff_utc = datetime.now(timezone.utc) - timedelta(hours=HOURS)
+    cutoff_utc = datetime.now(timezone.utc) - timedelta(hours=args.hours)
     print(f"Cutoff (UTC): {cutoff_utc.isoformat()}")
 
     kept = []
@@ -96,40 +233,40 @@ def main():
         title = it.get("title", "(no title)")
         pub_utc = parse_item_dt(it)
         if not pub_utc:
-            pretty_reason(False, title, "no parseable date")
+            log(False, it, title, "no parseable date")
             continue
 
         if pub_utc < cutoff_utc:
-            pretty_reason(False, title, f"too old: {pub_utc.isoformat()}")
+            log(False, it, title, f"too old: {pub_utc.isoformat()}")
             continue
 
-        content = (
+        text = strip_html(
             it.get("content_html")
             or it.get("content")
             or it.get("summary")
             or ""
         )
-        text = strip_html(content)
-        words = len(re.findall(r"\w+", text))
+        words = len(_WORD_RE.findall(text))
         if words < 30:
-            pretty_reason(False, title, f"too short ({words} words)")
+            log(False, it, title, f"too short ({words} words)")
             continue
 
         pub_local = pub_utc.astimezone(LOCAL_TZ)
         kept.append((it, pub_local, text))
-        pretty_reason(True, title, f"pub={pub_local.isoformat()} words={words}")
+        log(True, it, title, f"pub={pub_local.isoformat()} words={words}")
 
-        if len(kept) >= MAX_POSTS:
+        if len(kept) >= args.max_posts:
             break
 
     print(f"Candidates kept: {len(kept)}")
 
     created = []
     for it, pub_local, text in kept:
-        write_post(it, pub_local, text)
-        created.append(it.get("id", it.get("url", "unknown")))
+        write_post(it, pub_local, text, dry=args.dry_run)
+        created.append(it.get("id") or it.get("url") or "unknown")
 
-    print(json.dumps({"created": created}, indent=2))
+    # A dry run wrote nothing, so don't report its ids as created.
+    print(json.dumps({"would_create" if args.dry_run else "created": created}, indent=2))
 
 
 if __name__ == "__main__":